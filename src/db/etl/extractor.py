@@ -13,6 +13,7 @@ import time
 from typing import Any, BinaryIO, Dict, Optional
 
 from src.utils.di import get_service
+from src.utils.file_handler import parse_json
 from src.utils.interfaces import (
     ExtractorProtocol,
     FileHandlerProtocol,
@@ -250,14 +251,14 @@ class Extractor(ExtractorProtocol):
                 endpoints_path = os.path.join(temp_dir, "endpoints.json")
 
                 # Load messages
-                with open(messages_path, "r", encoding="utf-8") as f:
-                    messages = json.load(f)
+                with open(messages_path, "rb") as f:
+                    messages = parse_json(f.read())
 
                 # Load endpoints if available
                 endpoints = {}
                 if os.path.exists(endpoints_path):
-                    with open(endpoints_path, "r", encoding="utf-8") as f:
-                        endpoints = json.load(f)
+                    with open(endpoints_path, "rb") as f:
+                        endpoints = parse_json(f.read())
 
                 # Combine data
                 data = {
@@ -324,8 +325,8 @@ class Extractor(ExtractorProtocol):
             data = self.file_handler.read_json(file_path)
         else:
             # Fallback to direct reading
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = parse_json(f.read())
 
         # Calculate extraction time
         extraction_time_ms = (time.time() - start_time) * 1000
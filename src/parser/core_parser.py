@@ -6,6 +6,7 @@ This module provides core functions for parsing Skype export data, including
 timestamp parsing, content extraction, and message type handling.
 """
 
+import contextlib
 import datetime
 import gc
 import html
@@ -13,10 +14,24 @@ import json
 import logging
 import os
 import re
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import tarfile
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 # Import configuration utility
-from ..utils.config import get_message_type_description, load_config
+from ..utils.config import build_message_type_resolver, load_config
+
+# Import JSON helpers for lazily parsed documents
+from ..utils.file_handler import JSON_ARRAY_TYPES, materialize_json
 
 # Import centralized dependency handling
 from ..utils.dependencies import BEAUTIFULSOUP_AVAILABLE as BEAUTIFULSOUP
@@ -57,6 +72,9 @@ except ImportError:
 # Load configuration
 config = load_config(message_types_file="config/message_types.json")
 
+# Resolve message type descriptions once rather than per message
+_resolve_message_type = build_message_type_resolver(config)
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -334,12 +352,11 @@ def type_parser(msg_type: str) -> str:
         logger.warning(error_msg)
         raise InvalidInputError(error_msg)
 
-    # Use the configuration utility to get the message type description
-    description = get_message_type_description(config, msg_type)
+    # Use the prebuilt resolver to get the message type description
+    description = _resolve_message_type(msg_type)
 
     # Log unknown message types to help identify gaps in our configuration
-    default_format = config.get("default_message_format", "***Sent a {message_type}***")
-    if description == default_format.format(message_type=msg_type):
+    if msg_type not in config.get("message_types", {}):
         logger.info(f"Encountered unconfigured message type: {msg_type}")
 
     return description
@@ -536,6 +553,46 @@ def parse_skype_data(
         raise DataExtractionError(error_msg) from e
 
 
+@contextlib.contextmanager
+def _open_json_stream(file_path: str) -> Iterator[BinaryIO]:
+    """
+    Open the JSON data of a Skype export (JSON or TAR) for streaming.
+
+    For TAR archives, messages.json is read directly from the archive rather
+    than being extracted to a temporary file first.
+
+    Args:
+        file_path (str): Path to the Skype export file (JSON or TAR)
+
+    Yields:
+        BinaryIO: Seekable binary file object with the JSON data
+
+    Raises:
+        ValueError: If the file type is unsupported or messages.json is missing
+    """
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == ".json":
+        with open(file_path, "rb") as f:
+            yield f
+    elif file_ext == ".tar":
+        with tarfile.open(file_path, "r") as tar:
+            # Find messages.json
+            messages_file = None
+            for member in tar.getmembers():
+                if member.name.endswith("messages.json"):
+                    messages_file = member
+                    break
+
+            if not messages_file:
+                raise ValueError("No messages.json file found in TAR archive")
+
+            with tar.extractfile(messages_file) as f:
+                yield f
+    else:
+        raise ValueError(f"Unsupported file extension: {file_ext}")
+
+
 def parse_skype_data_streaming(
     file_path: str,
     user_display_name: str,
@@ -587,43 +644,8 @@ def parse_skype_data_streaming(
     }
 
     try:
-        # Determine if it's a JSON or TAR file
-        file_ext = os.path.splitext(file_path)[1].lower()
-
-        if file_ext == ".json":
-            json_file_path = file_path
-        elif file_ext == ".tar":
-            # Extract messages.json from TAR file
-            import tarfile
-
-            with tarfile.open(file_path, "r") as tar:
-                # Find messages.json
-                messages_file = None
-                for member in tar.getmembers():
-                    if member.name.endswith("messages.json"):
-                        messages_file = member
-                        break
-
-                if not messages_file:
-                    raise ValueError("No messages.json file found in TAR archive")
-
-                # Create temp directory if needed
-                temp_dir = os.path.join(os.path.dirname(file_path), "temp_extract")
-                os.makedirs(temp_dir, exist_ok=True)
-
-                # Extract messages.json
-                temp_path = os.path.join(temp_dir, "messages.json")
-                with tar.extractfile(messages_file) as source, open(
-                    temp_path, "wb"
-                ) as target:
-                    target.write(source.read())
-
-                json_file_path = temp_path
-        else:
-            raise ValueError(f"Unsupported file extension: {file_ext}")
-
         # Process the JSON file with streaming
-        with open(json_file_path, "rb") as f:
+        with _open_json_stream(file_path) as f:
             # Extract basic metadata first
             for prefix, event, value in ijson.parse(f):
                 if prefix == "userId":
@@ -678,10 +700,6 @@ def parse_skype_data_streaming(
                 if stats["message_count"] % 100000 == 0:
                     gc.collect()
 
-        # Clean up temp file if needed
-        if file_ext == ".tar" and os.path.exists(json_file_path):
-            os.remove(json_file_path)
-
         # Update statistics
         stats["end_time"] = datetime.datetime.now()
         stats["duration_seconds"] = (
@@ -737,43 +755,8 @@ def stream_conversations(file_path: str) -> Iterator[Dict[str, Any]]:
         raise InvalidInputError(error_msg)
 
     try:
-        # Determine if it's a JSON or TAR file
-        file_ext = os.path.splitext(file_path)[1].lower()
-
-        if file_ext == ".json":
-            json_file_path = file_path
-        elif file_ext == ".tar":
-            # Extract messages.json from TAR file
-            import tarfile
-
-            with tarfile.open(file_path, "r") as tar:
-                # Find messages.json
-                messages_file = None
-                for member in tar.getmembers():
-                    if member.name.endswith("messages.json"):
-                        messages_file = member
-                        break
-
-                if not messages_file:
-                    raise ValueError("No messages.json file found in TAR archive")
-
-                # Create temp directory if needed
-                temp_dir = os.path.join(os.path.dirname(file_path), "temp_extract")
-                os.makedirs(temp_dir, exist_ok=True)
-
-                # Extract messages.json
-                temp_path = os.path.join(temp_dir, "messages.json")
-                with tar.extractfile(messages_file) as source, open(
-                    temp_path, "wb"
-                ) as target:
-                    target.write(source.read())
-
-                json_file_path = temp_path
-        else:
-            raise ValueError(f"Unsupported file extension: {file_ext}")
-
         # Stream conversations from the JSON file
-        with open(json_file_path, "rb") as f:
+        with _open_json_stream(file_path) as f:
             conversation_count = 0
             for conversation in ijson.items(f, "conversations.item"):
                 conversation_count += 1
@@ -786,10 +769,6 @@ def stream_conversations(file_path: str) -> Iterator[Dict[str, Any]]:
                 if conversation_count % 1000 == 0:
                     gc.collect()
 
-        # Clean up temp file if needed
-        if file_ext == ".tar" and os.path.exists(json_file_path):
-            os.remove(json_file_path)
-
     except Exception as e:
         error_msg = f"Error streaming conversations: {e}"
         logger.error(error_msg)
@@ -857,11 +836,10 @@ def _process_conversations(
     """
     structured_data = {}
 
-    # Process each conversation
-    for i in range(len(raw_data["conversations"])):
+    # Process each conversation (iterating also keeps lazy documents linear)
+    for i, conversation in enumerate(raw_data["conversations"]):
         try:
             # Extract conversation metadata
-            conversation = raw_data["conversations"][i]
             conv_id = conversation["id"]
 
             # Process display name
@@ -956,10 +934,14 @@ def _process_messages(
     """
     # Support both newer "MessageList" format and older "messages" format
     messages = []
-    if "MessageList" in conversation and isinstance(conversation["MessageList"], list):
+    if "MessageList" in conversation and isinstance(
+        conversation["MessageList"], JSON_ARRAY_TYPES
+    ):
         messages = conversation["MessageList"]
         logger.debug(f"Found MessageList with {len(messages)} messages")
-    elif "messages" in conversation and isinstance(conversation["messages"], list):
+    elif "messages" in conversation and isinstance(
+        conversation["messages"], JSON_ARRAY_TYPES
+    ):
         messages = conversation["messages"]
         logger.debug(f"Found messages with {len(messages)} messages")
     else:
@@ -991,6 +973,10 @@ def _process_single_message(
     Returns:
         dict: Structured message data
     """
+    # Message handlers expect plain dicts, so lazy messages are converted
+    # one at a time rather than materializing the whole document up front
+    msg = materialize_json(msg)
+
     # Extract message data
     msg_timestamp = msg.get("originalarrivaltime", "")
     msg_from = msg.get("from", "")
@@ -19,7 +19,7 @@ import os
 import sys
 
 from ..utils.dependencies import PSYCOPG2_AVAILABLE
-from ..utils.file_handler import read_file, read_tarfile
+from ..utils.file_handler import read_file_lazy, read_tarfile
 from .core_parser import id_selector, parse_skype_data
 from .exceptions import (
     DataExtractionError,
@@ -188,7 +188,7 @@ def main():
         # Read the Skype export file
         try:
             main_file = (
-                read_file(args.input_file)
+                read_file_lazy(args.input_file)
                 if not args.extract_tar
                 else read_tarfile(args.input_file, args.select_json)
             )
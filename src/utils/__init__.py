@@ -5,7 +5,9 @@ Utility functions for the Skype Parser project.
 from .file_utils import safe_filename
 from .file_handler import (
     read_file,
+    read_file_lazy,
     read_file_obj,
+    read_file_streaming,
     read_tarfile,
     read_tar_file_obj
 )
@@ -42,7 +44,9 @@ __all__ = [
     # File utilities
     'safe_filename',
     'read_file',
+    'read_file_lazy',
     'read_file_obj',
+    'read_file_streaming',
     'read_tarfile',
     'read_tar_file_obj',
 
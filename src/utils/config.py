@@ -6,10 +6,13 @@ from environment variables, configuration files, and command-line arguments.
 """
 
 import copy
+import functools
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +60,72 @@ DEFAULT_PERFORMANCE_CONFIG = {
 }
 
 
+def _parse_bool(value: str) -> bool:
+    """
+    Parse a boolean flag from an environment variable value.
+
+    Args:
+        value (str): Environment variable value
+
+    Returns:
+        bool: True for "true", "yes" or "1" (case-insensitive)
+    """
+    return value.lower() in ("true", "yes", "1")
+
+
+# Environment variables that override configuration values, as
+# (variable name, path in the configuration, converter) entries
+_ENV_MAP = (
+    # Database settings
+    ("POSTGRES_HOST", ("database", "host"), str),
+    ("POSTGRES_PORT", ("database", "port"), int),
+    ("POSTGRES_DB", ("database", "dbname"), str),
+    ("POSTGRES_USER", ("database", "user"), str),
+    ("POSTGRES_PASSWORD", ("database", "password"), str),
+    # Output settings
+    ("OUTPUT_DIR", ("output", "directory"), str),
+    ("OUTPUT_OVERWRITE", ("output", "overwrite"), _parse_bool),
+    # Logging settings
+    ("LOG_LEVEL", ("logging", "level"), str),
+    ("LOG_FILE", ("logging", "file"), str),
+)
+
+
+def _copy_default_config() -> Dict[str, Any]:
+    """
+    Copy DEFAULT_CONFIG so the copy can be modified safely.
+
+    DEFAULT_CONFIG only nests flat dicts of immutable values, so copying each
+    nested dict is enough and avoids the overhead of copy.deepcopy.
+
+    Returns:
+        Dict[str, Any]: Independent copy of DEFAULT_CONFIG
+    """
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in DEFAULT_CONFIG.items()
+    }
+
+
+def _file_mtime(path: Optional[str]) -> Optional[int]:
+    """
+    Get the modification time of a file for use in a cache key.
+
+    Args:
+        path (str, optional): Path to the file
+
+    Returns:
+        Optional[int]: Modification time in nanoseconds, or None if the path
+            is not set or cannot be accessed
+    """
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_config(
     config_file: Optional[str] = None, message_types_file: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -64,6 +133,13 @@ def load_config(
     Load configuration from environment variables and optionally from JSON files.
     Environment variables take precedence over file configuration.
 
+    Results are cached by file path, file modification time and the values of
+    the environment variables that override configuration, so repeated calls
+    are cheap; changed files and environment variables are picked up on the
+    next call. Call load_config.cache_clear() to discard cached
+    configurations. Each call returns its own copy of the cached
+    configuration, which callers may modify freely.
+
     Args:
         config_file (str, optional): Path to a JSON configuration file
         message_types_file (str, optional): Path to a JSON message types configuration file
@@ -71,66 +147,64 @@ def load_config(
     Returns:
         Dict[str, Any]: Configuration dictionary
     """
-    # Start with default configuration (deep copy to avoid modifying DEFAULT_CONFIG)
-    config = copy.deepcopy(DEFAULT_CONFIG)
-
-    # Load from main config file if provided
-    if config_file and os.path.exists(config_file):
-        try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                file_config = json.load(f)
-                # Merge file config with defaults (deep merge)
-                _deep_update(config, file_config)
-            logger.info(f"Loaded configuration from {config_file}")
-        except Exception as e:
-            logger.warning(f"Error loading configuration from {config_file}: {e}")
-
-    # Load message types from separate file if provided
-    if message_types_file and os.path.exists(message_types_file):
-        try:
-            with open(message_types_file, "r", encoding="utf-8") as f:
-                message_types_config = json.load(f)
-                # Merge message types config with defaults
-                if "message_types" in message_types_config:
-                    config["message_types"] = message_types_config["message_types"]
-                if "default_message_format" in message_types_config:
-                    config["default_message_format"] = message_types_config[
-                        "default_message_format"
-                    ]
-            logger.info(f"Loaded message types configuration from {message_types_file}")
-        except Exception as e:
-            logger.warning(
-                f"Error loading message types configuration from {message_types_file}: {e}"
-            )
+    cached = _load_config_cached(
+        config_file,
+        _file_mtime(config_file),
+        message_types_file,
+        _file_mtime(message_types_file),
+        _env_snapshot(),
+    )
+    return config_to_dict(cached)
 
-    # Override with environment variables
-    # Database settings
-    if os.getenv("POSTGRES_HOST"):
-        config["database"]["host"] = os.getenv("POSTGRES_HOST")
-    if os.getenv("POSTGRES_PORT"):
-        config["database"]["port"] = int(os.getenv("POSTGRES_PORT"))
-    if os.getenv("POSTGRES_DB"):
-        config["database"]["dbname"] = os.getenv("POSTGRES_DB")
-    if os.getenv("POSTGRES_USER"):
-        config["database"]["user"] = os.getenv("POSTGRES_USER")
-    if os.getenv("POSTGRES_PASSWORD"):
-        config["database"]["password"] = os.getenv("POSTGRES_PASSWORD")
 
-    # Output settings
-    if os.getenv("OUTPUT_DIR"):
-        config["output"]["directory"] = os.getenv("OUTPUT_DIR")
-    if os.getenv("OUTPUT_OVERWRITE"):
-        config["output"]["overwrite"] = os.getenv("OUTPUT_OVERWRITE").lower() in (
-            "true",
-            "yes",
-            "1",
-        )
+def _env_snapshot() -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Read the current values of the environment variables that override configuration.
 
-    # Logging settings
-    if os.getenv("LOG_LEVEL"):
-        config["logging"]["level"] = os.getenv("LOG_LEVEL")
-    if os.getenv("LOG_FILE"):
-        config["logging"]["file"] = os.getenv("LOG_FILE")
+    Returns:
+        tuple: (variable name, value) pairs for the variables in _ENV_MAP
+    """
+    # Look os.environ up once and do a single get per variable
+    environ = os.environ
+    return tuple((env_name, environ.get(env_name)) for env_name, _, _ in _ENV_MAP)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(
+    config_file: Optional[str],
+    config_mtime: Optional[int],
+    message_types_file: Optional[str],
+    message_types_mtime: Optional[int],
+    env: Tuple[Tuple[str, Optional[str]], ...],
+) -> Dict[str, Any]:
+    """
+    Build the configuration for load_config.
+
+    The modification times are only part of the cache key, so that edited
+    files are reloaded. The result is shared by every caller with the same
+    key and must not be modified; load_config hands out copies of it.
+
+    Args:
+        config_file (str, optional): Path to a JSON configuration file
+        config_mtime (int, optional): Modification time of config_file in ns
+        message_types_file (str, optional): Path to a JSON message types configuration file
+        message_types_mtime (int, optional): Modification time of message_types_file in ns
+        env (tuple): (variable name, value) pairs for the variables in _ENV_MAP
+
+    Returns:
+        Dict[str, Any]: Cached configuration dictionary
+    """
+    # Start with default configuration (copied to avoid modifying DEFAULT_CONFIG)
+    config = _copy_default_config()
+
+    file_config, message_types_config = _read_config_files(config_file, message_types_file)
+    # Merge file config with defaults (deep merge)
+    _deep_update(config, file_config)
+    # Message types settings replace the defaults as a whole
+    config.update(message_types_config)
+
+    # Override with environment variables
+    _deep_update(config, _env_overrides(env))
 
     # Add default performance configuration if not present
     for key, value in DEFAULT_PERFORMANCE_CONFIG.items():
@@ -140,6 +214,169 @@ def load_config(
     return config
 
 
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
+def _load_json_object(path: Optional[str], label: str) -> Dict[str, Any]:
+    """
+    Load a JSON configuration file that must contain an object.
+
+    Errors are logged as warnings rather than raised.
+
+    Args:
+        path (str, optional): Path to the JSON file
+        label (str): Description of the file used in log messages
+
+    Returns:
+        Dict[str, Any]: The loaded object, or an empty dict if the path is not
+            set, the file is missing or it cannot be loaded
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+        if not isinstance(loaded, dict):
+            raise ValueError("configuration must be a JSON object")
+    except Exception as e:
+        logger.warning(f"Error loading {label} from {path}: {e}")
+        return {}
+    logger.info(f"Loaded {label} from {path}")
+    return loaded
+
+
+def _read_config_files(
+    config_file: Optional[str], message_types_file: Optional[str]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Read the configuration layers stored in JSON files.
+
+    Files that are not set, missing or invalid contribute an empty layer.
+
+    Args:
+        config_file (str, optional): Path to a JSON configuration file
+        message_types_file (str, optional): Path to a JSON message types configuration file
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: Settings from config_file, and the
+            message_types/default_message_format settings from message_types_file
+    """
+    file_config = _load_json_object(config_file, "configuration")
+    message_types = _load_json_object(message_types_file, "message types configuration")
+    message_types_config = {
+        key: message_types[key]
+        for key in ("message_types", "default_message_format")
+        if key in message_types
+    }
+    return file_config, message_types_config
+
+
+def _env_overrides(env: Tuple[Tuple[str, Optional[str]], ...]) -> Dict[str, Any]:
+    """
+    Build the nested configuration layer set by environment variables.
+
+    Args:
+        env (tuple): (variable name, value) pairs for the variables in _ENV_MAP
+
+    Returns:
+        Dict[str, Any]: Converted values of the variables that are set
+    """
+    overrides = {}
+    for (env_name, value), (_, path, convert) in zip(env, _ENV_MAP):
+        if value:
+            target = overrides
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = convert(value)
+    return overrides
+
+
+class _ChainedConfig(ChainMap):
+    """
+    ChainMap over configuration layers that merges nested sections lazily.
+
+    As in _deep_update, only plain dicts are merged: a key whose value is a
+    dict in the first layer that has it returns another _ChainedConfig over
+    the dicts stored under that key, down to the first layer with a non-dict
+    value. Any other value is returned from the first layer that has the key.
+    """
+
+    def __getitem__(self, key: Any) -> Any:
+        sections = []
+        for mapping in self.maps:
+            if key in mapping:
+                value = mapping[key]
+                if type(value) is not dict:
+                    if not sections:
+                        return value
+                    break
+                sections.append(value)
+        if not sections:
+            return self.__missing__(key)
+        # Start with an empty layer so writes never reach the shared layers
+        return _ChainedConfig({}, *sections)
+
+
+def load_config_chained(
+    config_file: Optional[str] = None, message_types_file: Optional[str] = None
+) -> ChainMap:
+    """
+    Load configuration as a chain of layers instead of a merged copy.
+
+    Lookups resolve to the same values as load_config(), but nothing is
+    merged up front: the environment overrides, the file settings and the
+    defaults are chained, and nested sections such as "database" are chained
+    when they are accessed. DEFAULT_CONFIG itself is one of the layers, so
+    this is meant for callers that only read the configuration; writes to a
+    nested section only affect the view they were made on.
+
+    Args:
+        config_file (str, optional): Path to a JSON configuration file
+        message_types_file (str, optional): Path to a JSON message types configuration file
+
+    Returns:
+        ChainMap: Configuration layers, highest precedence first
+    """
+    file_config, message_types_config = _read_config_files(config_file, message_types_file)
+    # Read-only sections are not merged, so message types replace the defaults
+    message_types_layer = {
+        key: MappingProxyType(value) if type(value) is dict else value
+        for key, value in message_types_config.items()
+    }
+    return _ChainedConfig(
+        _env_overrides(_env_snapshot()),
+        message_types_layer,
+        file_config,
+        DEFAULT_CONFIG,
+        DEFAULT_PERFORMANCE_CONFIG,
+    )
+
+
+# Leaf value types that can be shared between copies as-is
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def config_to_dict(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Get a mutable deep copy of a configuration mapping.
+
+    Args:
+        config (Mapping[str, Any]): Configuration, e.g. as returned by load_config_chained
+
+    Returns:
+        Dict[str, Any]: Configuration as plain, independent dictionaries
+    """
+    copied = {}
+    for key, value in config.items():
+        if isinstance(value, Mapping):
+            value = config_to_dict(value)
+        elif type(value) not in _IMMUTABLE_TYPES:
+            # Only containers such as lists need copying; scalars are shared
+            value = copy.deepcopy(value)
+        copied[key] = value
+    return copied
+
+
 def get_db_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Extract database configuration from the main configuration.
@@ -152,7 +389,7 @@ def get_db_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         Dict[str, Any]: Database configuration dictionary
     """
     if config is None:
-        config = copy.deepcopy(DEFAULT_CONFIG)
+        config = _copy_default_config()
 
     return {
         "host": config["database"]["host"],
@@ -183,17 +420,78 @@ def get_message_type_description(config: Dict[str, Any], msg_type: str) -> str:
     return message_types.get(msg_type, default_format.format(message_type=msg_type))
 
 
+class _MessageTypeDescriptions(dict):
+    """
+    Message type descriptions that fill in unknown types on lookup.
+
+    Descriptions for unconfigured message types are formatted from the
+    default message format once and then memoized.
+    """
+
+    def __init__(self, message_types: Mapping[str, str], default_format: str):
+        super().__init__(message_types)
+        self.default_format = default_format
+
+    def __missing__(self, msg_type: str) -> str:
+        description = self.default_format.format(message_type=msg_type)
+        self[msg_type] = description
+        return description
+
+
+def build_message_type_resolver(config: Mapping[str, Any]) -> Callable[[str], str]:
+    """
+    Build a fast message type lookup for a configuration.
+
+    The returned function gives the same result as
+    get_message_type_description(config, msg_type), but resolves the
+    configuration once instead of on every call, which matters when it is
+    called for every message.
+
+    Args:
+        config (Mapping[str, Any]): Configuration dictionary
+
+    Returns:
+        Callable[[str], str]: Function mapping a message type to its description
+    """
+    descriptions = _MessageTypeDescriptions(
+        config.get("message_types", {}),
+        config.get("default_message_format", "***Sent a {message_type}***"),
+    )
+
+    def resolve(msg_type: str) -> str:
+        if not msg_type:
+            return "Unknown message type"
+        return descriptions[msg_type]
+
+    return resolve
+
+
+# Level names accepted in the logging configuration, including the aliases
+# the logging module defines
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+
 def setup_logging(config: Dict[str, Any]) -> None:
     """
     Set up logging based on configuration.
 
+    Calls repeating the effective settings of the last call return without
+    building (and opening) a new set of handlers; changed settings
+    reconfigure logging.
+
     Args:
         config (Dict[str, Any]): Configuration dictionary
     """
-    # Import here to avoid circular imports
-    from src.utils.structured_logging import setup_logging as setup_structured_logging
-
-    log_level = config["logging"]["level"].upper()
+    log_level = _LEVELS.get(config["logging"]["level"].upper(), logging.INFO)
     log_file = config["logging"]["file"]
 
     # Get additional logging configuration with defaults
@@ -203,6 +501,16 @@ def setup_logging(config: Dict[str, Any]) -> None:
     max_bytes = config.get("logging", {}).get("max_bytes", 10 * 1024 * 1024)  # 10 MB
     backup_count = config.get("logging", {}).get("backup_count", 5)
 
+    settings = (log_level, log_file, json_format, structured, rotation, max_bytes, backup_count)
+    if getattr(setup_logging, "_settings", None) == settings:
+        logging.getLogger(__name__).debug(
+            "Logging already configured with the same settings, skipping setup"
+        )
+        return
+
+    # Import here to avoid circular imports
+    from src.utils.structured_logging import setup_logging as setup_structured_logging
+
     # Set up structured logging
     setup_structured_logging(
         level=log_level,
@@ -213,9 +521,10 @@ def setup_logging(config: Dict[str, Any]) -> None:
         max_bytes=max_bytes,
         backup_count=backup_count,
     )
+    setup_logging._settings = settings
 
     # Log the configuration (excluding sensitive data)
-    safe_config = copy.deepcopy(config)
+    safe_config = config_to_dict(config)
     if "database" in safe_config and "password" in safe_config["database"]:
         safe_config["database"]["password"] = "******"
 
@@ -228,12 +537,21 @@ def _deep_update(target: Dict, source: Dict) -> None:
     """
     Deep update a nested dictionary with another dictionary.
 
+    Nested dictionaries are merged with an explicit stack rather than by
+    recursion. Only plain dicts (as produced by json.load) are merged; any
+    other value replaces the target value.
+
     Args:
         target (Dict): Target dictionary to update
         source (Dict): Source dictionary with new values
     """
-    for key, value in source.items():
-        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-            _deep_update(target[key], value)
-        else:
-            target[key] = value
+    stack = [(target, source)]
+    while stack:
+        current_target, current_source = stack.pop()
+        for key in current_source:
+            value = current_source[key]
+            target_value = current_target.get(key)
+            if type(target_value) is dict and type(value) is dict:
+                stack.append((target_value, value))
+            else:
+                current_target[key] = value
@@ -6,11 +6,24 @@ This module provides utilities for reading and processing Skype export files,
 including JSON and TAR archives.
 """
 
+import fnmatch
 import json
 import logging
 import os
+import re
 import tarfile
-from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from src.utils.interfaces import FileHandlerProtocol
 from src.utils.validation import (
@@ -34,10 +47,325 @@ except ImportError:
         "ijson library not available. Streaming JSON processing will not be supported."
     )
 
+# Try to import faster JSON parsers, falling back to the standard library
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+if not ORJSON_AVAILABLE and not SIMDJSON_AVAILABLE:
+    logger.debug(
+        "orjson and pysimdjson not available. Falling back to the standard json module."
+    )
+
+# simdjson parsers are not thread-safe, so each thread gets its own parser
+# that is reused across calls to keep its internal buffers allocated
+_PARSER_LOCAL = threading.local()
+
+
+def _get_parser() -> Any:
+    """
+    Get the simdjson parser for the current thread, creating it if needed.
+
+    Returns:
+        simdjson.Parser instance owned by the current thread
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = simdjson.Parser()
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+# Per-thread buffer that TAR members are read into, see _read_into_buffer
+_BUFFER_LOCAL = threading.local()
+
+
+def _read_into_buffer(file_obj: BinaryIO, size: int) -> memoryview:
+    """
+    Read up to size bytes from a file object into the current thread's buffer.
+
+    The buffer is reused across calls (and only replaced by a larger one when
+    needed), so reading large members does not allocate a new bytes object
+    each time. The returned view is only valid until the next call on the
+    same thread.
+
+    Args:
+        file_obj: Binary file object to read from
+        size: Number of bytes to read
+
+    Returns:
+        View of the bytes read
+    """
+    buffer = getattr(_BUFFER_LOCAL, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        # Replaced rather than resized, so views handed out earlier stay valid
+        buffer = bytearray(size)
+        _BUFFER_LOCAL.buffer = buffer
+
+    view = memoryview(buffer)[:size]
+    filled = 0
+    while filled < size:
+        count = file_obj.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return view[:filled]
+
+
+# Integer tokens of 19 or more digits may not fit in 64 bits, which orjson
+# silently converts to float. Digits inside quoted strings, fractions and
+# exponents are not matched.
+_BIG_INT_PATTERN = r'(?<![\w."+-])-?\d{19,}(?![\w."])'
+_BIG_INT_BYTES = re.compile(_BIG_INT_PATTERN.encode("ascii"))
+_BIG_INT_STR = re.compile(_BIG_INT_PATTERN)
+
+
+def _has_big_int(content: Union[bytes, bytearray, memoryview, str]) -> bool:
+    """Check whether JSON content may contain an integer beyond 64 bits."""
+    pattern = _BIG_INT_STR if isinstance(content, str) else _BIG_INT_BYTES
+    return pattern.search(content) is not None
+
+
+def parse_json(content: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse UTF-8 JSON content with the fastest available parser.
+
+    orjson is preferred, then pysimdjson, then the standard library. Raw bytes
+    are handed to the parser directly so no separate UTF-8 decode is needed.
+    Documents the fast parsers reject or cannot represent exactly (lone
+    surrogates, NaN/Infinity, integers beyond 64 bits) are parsed again with
+    the standard library, so the result never depends on which parser is
+    installed.
+
+    Args:
+        content: JSON document as bytes (or a bytes-like buffer) or str
+
+    Returns:
+        The parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid UTF-8 JSON
+    """
+    try:
+        if ORJSON_AVAILABLE:
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+            data = orjson.loads(content)
+            if not _has_big_int(content):
+                return data
+        elif SIMDJSON_AVAILABLE:
+            # The document is fully materialized before returning so the shared
+            # parser holds no live references and can be reused on the next call
+            return materialize_json(_simdjson_parse(_get_parser(), content))
+    except json.JSONDecodeError as e:
+        logger.debug(f"Fast JSON parser failed, retrying with json: {e}")
+
+    if not isinstance(content, str):
+        # Decode explicitly rather than letting json.loads detect UTF-16/32,
+        # so only UTF-8 is accepted whichever parser is installed
+        try:
+            content = str(content, "utf-8")
+        except UnicodeDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid UTF-8: {e}", "", 0) from e
+    return json.loads(content)
+
+
+def _simdjson_parse(parser: Any, content: Union[bytes, str]) -> Any:
+    """
+    Parse content with a simdjson parser, normalizing parse errors.
+
+    Args:
+        parser: simdjson.Parser instance to parse with
+        content: JSON document as bytes or str
+
+    Returns:
+        The lazy simdjson document (or a scalar for scalar documents)
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    try:
+        return parser.parse(content)
+    except (ValueError, RuntimeError) as e:
+        # Integers beyond 64 bits raise RuntimeError rather than ValueError
+        raise json.JSONDecodeError(str(e), "", 0) from e
+
+
+# Sequence types that may appear in parsed JSON data
+JSON_ARRAY_TYPES = (list, simdjson.Array) if SIMDJSON_AVAILABLE else (list,)
+
+
+def materialize_json(value: Any) -> Any:
+    """
+    Convert a lazy simdjson proxy into plain Python dicts and lists.
+
+    Values that are not simdjson proxies are returned unchanged, so this can
+    be applied to data from either the lazy or the eager readers.
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        The value as plain Python objects
+    """
+    if SIMDJSON_AVAILABLE:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
+
+# Characters with a special meaning in regular expressions
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()\\")
+
+
+def _regex_literal(pattern: str) -> Optional[str]:
+    """
+    Get the literal text a regex pattern matches, if it is a plain literal.
+
+    Args:
+        pattern: Regex pattern, possibly containing escaped punctuation
+
+    Returns:
+        The unescaped literal, or None if the pattern uses regex syntax
+    """
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            # Escapes such as \d or \w are character classes, not literals
+            if char.isalnum() or char == "_":
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in _REGEX_METACHARACTERS:
+            return None
+        else:
+            chars.append(char)
+    return None if escaped else "".join(chars)
+
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+def _glob_filter(file_pattern: str) -> Callable[[str], bool]:
+    """
+    Build a predicate for a shell-style glob pattern such as "*.json".
+
+    Globs made of a literal with leading and/or trailing "*" are answered
+    with str methods; other globs are matched with fnmatch.
+
+    Args:
+        file_pattern: Glob that must match the whole name
+
+    Returns:
+        Function returning True for names matching the glob
+    """
+    literal = file_pattern.strip("*")
+    if literal and _GLOB_CHARACTERS.isdisjoint(literal):
+        leading = file_pattern.startswith("*")
+        trailing = file_pattern.endswith("*")
+        if leading and trailing:
+            return lambda name: literal in name
+        if leading:
+            return lambda name: name.endswith(literal)
+        if trailing:
+            return lambda name: name.startswith(literal)
+
+    return re.compile(fnmatch.translate(file_pattern)).match
+
+
+def _literal_regex_filter(file_pattern: str) -> Optional[Callable[[str], bool]]:
+    """
+    Build a str-method predicate for a regex that is a plain literal test.
+
+    Regexes such as r".*\\.json$" or r"messages\\.json" are really suffix,
+    substring, equality or prefix tests and are answered without the regex
+    engine.
+
+    Args:
+        file_pattern: Valid regex pattern
+
+    Returns:
+        Function equivalent to re.match(file_pattern, name), or None if the
+        pattern needs the regex engine
+    """
+    body = file_pattern[1:] if file_pattern.startswith("^") else file_pattern
+
+    # A trailing "$" is an anchor unless the backslash before it is unescaped
+    anchored_end = False
+    if body.endswith("$"):
+        trailing_backslashes = len(body[:-1]) - len(body[:-1].rstrip("\\"))
+        if trailing_backslashes % 2 == 0:
+            body = body[:-1]
+            anchored_end = True
+
+    if body.startswith(".*"):
+        literal = _regex_literal(body[2:])
+        if literal is not None:
+            if anchored_end:
+                return lambda name: name.endswith(literal)
+            return lambda name: literal in name
+    else:
+        literal = _regex_literal(body)
+        if literal is not None:
+            if anchored_end:
+                return lambda name: name == literal
+            return lambda name: name.startswith(literal)
+
+    return None
+
+
+def _compile_name_filter(file_pattern: str, glob: bool = False) -> Callable[[str], bool]:
+    """
+    Build a predicate for a TAR member name filter.
+
+    Patterns are regexes and the predicate is equivalent to
+    re.match(file_pattern, name). Common regexes that are really prefix,
+    suffix or substring tests are answered with str methods instead of the
+    regex engine, see _literal_regex_filter. Anything else falls back to a
+    compiled regex.
+
+    The pattern is a shell-style glob matching the whole name instead when
+    glob is True, or when it is not a valid regex (e.g. "*.json").
+
+    Args:
+        file_pattern: Regex matched against the start of each name, or glob
+        glob: Whether to treat the pattern as a glob
+
+    Returns:
+        Function returning True for names matching the pattern
+    """
+    if glob:
+        return _glob_filter(file_pattern)
+
+    try:
+        regex = re.compile(file_pattern)
+    except re.error:
+        # Patterns such as "*.json" can only be meant as globs
+        return _glob_filter(file_pattern)
+
+    literal_filter = _literal_regex_filter(file_pattern)
+    if literal_filter is not None:
+        return literal_filter
+    return regex.match
+
 
 # Add extract_tar_contents function for backward compatibility
 def extract_tar_contents(
-    tar_path: str, output_dir: str, file_pattern: str = None
+    tar_path: str, output_dir: str, file_pattern: str = None, glob: bool = False
 ) -> List[str]:
     """
     Extract the contents of a TAR file to a directory.
@@ -48,6 +376,7 @@ def extract_tar_contents(
         tar_path: Path to the TAR file
         output_dir: Directory to extract to
         file_pattern: Optional regex pattern to filter files by name
+        glob: Whether file_pattern is a shell-style glob instead of a regex
 
     Returns:
         List of extracted file paths
@@ -62,21 +391,22 @@ def extract_tar_contents(
     os.makedirs(output_dir, exist_ok=True)
 
     # Extract the TAR file
-    with tarfile.open(tar_path, "r") as tar:
-        # Filter files if a pattern is provided
-        if file_pattern:
-            import re
-
-            pattern = re.compile(file_pattern)
-            members_to_extract = [m for m in tar.getmembers() if pattern.match(m.name)]
-            tar.extractall(path=output_dir, members=members_to_extract)
-            extracted_files = [
-                os.path.join(output_dir, member.name) for member in members_to_extract
-            ]
-        else:
-            tar.extractall(path=output_dir)
+    if file_pattern:
+        # Filter files while streaming through the archive once, so compressed
+        # archives are only decompressed a single time
+        matches = _compile_name_filter(file_pattern, glob)
+        extracted_files = []
+        with tarfile.open(tar_path, "r|*") as tar:
+            for member in tar:
+                if matches(member.name):
+                    tar.extract(member, path=output_dir)
+                    extracted_files.append(os.path.join(output_dir, member.name))
+    else:
+        with tarfile.open(tar_path, "r") as tar:
+            members = tar.getmembers()
+            tar.extractall(path=output_dir, members=members)
             extracted_files = [
-                os.path.join(output_dir, member.name) for member in tar.getmembers()
+                os.path.join(output_dir, member.name) for member in members
             ]
 
     logger.info(f"Extracted {len(extracted_files)} files from {tar_path}")
@@ -84,13 +414,16 @@ def extract_tar_contents(
 
 
 # Add list_tar_contents function for backward compatibility
-def list_tar_contents(tar_path: str, file_pattern: str = None) -> List[str]:
+def list_tar_contents(
+    tar_path: str, file_pattern: str = None, glob: bool = False
+) -> List[str]:
     """
     List the contents of a TAR file.
 
     Args:
         tar_path: Path to the TAR file
         file_pattern: Optional regex pattern to filter files by name
+        glob: Whether file_pattern is a shell-style glob instead of a regex
 
     Returns:
         List of file names in the TAR file
@@ -104,11 +437,9 @@ def list_tar_contents(tar_path: str, file_pattern: str = None) -> List[str]:
     # List the contents of the TAR file
     with tarfile.open(tar_path, "r") as tar:
         if file_pattern:
-            import re
-
-            pattern = re.compile(file_pattern)
+            matches = _compile_name_filter(file_pattern, glob)
             file_names = [
-                member.name for member in tar.getmembers() if pattern.match(member.name)
+                member.name for member in tar.getmembers() if matches(member.name)
             ]
         else:
             file_names = [member.name for member in tar.getmembers()]
@@ -117,92 +448,196 @@ def list_tar_contents(tar_path: str, file_pattern: str = None) -> List[str]:
     return file_names
 
 
-# Add read_tarfile function for backward compatibility
-def read_tarfile(
-    file_path: str, auto_select: bool = False, select_json: Optional[int] = None
-) -> Dict[str, Any]:
+def _selection_error(error_msg: str) -> ValueError:
+    """
+    Log a TAR member selection error and build the exception to raise.
+
+    Args:
+        error_msg: Error message
+
+    Returns:
+        ValueError with the message
+    """
+    logger.error(error_msg)
+    return ValueError(error_msg)
+
+
+def _iter_json_members(tar: tarfile.TarFile) -> Iterator[Tuple[tarfile.TarInfo, str]]:
     """
-    Read data from a tar file.
+    Iterate over the JSON members of a TAR archive.
+
+    Iterating the archive reads member headers on demand, so callers that
+    stop early never load the headers of the remaining members.
+
+    Args:
+        tar: Opened TAR archive
+
+    Yields:
+        (member, lowercased member name) for each member ending in .json
+    """
+    for member in tar:
+        name = member.name.lower()
+        if name.endswith(".json"):
+            yield member, name
+
+
+def _select_json_by_index(
+    json_members: Iterator[Tuple[tarfile.TarInfo, str]], select_json: int
+) -> tarfile.TarInfo:
+    """
+    Select the JSON member at the given index.
 
     Args:
-        file_path: Path to the tar file
+        json_members: JSON members, as produced by _iter_json_members
+        select_json: Index of the JSON file to select (0-based)
+
+    Returns:
+        The selected TAR member
+
+    Raises:
+        ValueError: If there are no JSON files or the index is out of range
+    """
+    json_count = 0
+    for member, _ in json_members:
+        if json_count == select_json:
+            return member
+        json_count += 1
+
+    if json_count == 0:
+        raise _selection_error("No JSON files found in TAR archive")
+    raise _selection_error(
+        f"Invalid JSON file index {select_json}. Only {json_count} JSON files available."
+    )
+
+
+def _select_main_json(json_members: Iterator[Tuple[tarfile.TarInfo, str]]) -> tarfile.TarInfo:
+    """
+    Select the main data file (usually messages.json or similar).
+
+    This is a simplified heuristic and might need adjustment: the first JSON
+    member whose name mentions "message" or "export" wins, otherwise the
+    first JSON member.
+
+    Args:
+        json_members: JSON members, as produced by _iter_json_members
+
+    Returns:
+        The selected TAR member
+
+    Raises:
+        ValueError: If there are no JSON files
+    """
+    first_json = None
+    for member, name in json_members:
+        if "message" in name or "export" in name:
+            return member
+        if first_json is None:
+            first_json = member
+
+    if first_json is None:
+        raise _selection_error("No JSON files found in TAR archive")
+    return first_json
+
+
+def _select_json_member(
+    tar: tarfile.TarFile, auto_select: bool = False, select_json: Optional[int] = None
+) -> tarfile.TarInfo:
+    """
+    Select the JSON member to read from an opened TAR archive.
+
+    The archive is scanned lazily and the scan stops at the selected member.
+
+    Args:
+        tar: Opened TAR archive
         auto_select: Whether to automatically select the main data file
         select_json: Index of the JSON file to select (0-based)
 
     Returns:
-        The data read from the tar file
+        The selected TAR member
 
     Raises:
-        ValueError: If the tar file doesn't exist or is invalid
-        Exception: If an error occurs during file reading
+        ValueError: If no JSON file can be selected
     """
-    logger.info(f"Reading tar file: {file_path}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Files in archive: {tar.getnames()}")
 
-    # Validate tar file
-    validate_file_exists(file_path)
-    validate_tar_file(file_path)
+    json_members = _iter_json_members(tar)
 
-    try:
-        # Open TAR file
-        with tarfile.open(file_path, "r") as tar:
-            # List all files in the archive
-            members = tar.getmembers()
-            logger.debug(f"Files in archive: {[m.name for m in members]}")
+    # Select the JSON file based on the parameters
+    if select_json is not None:
+        selected_file = _select_json_by_index(json_members, select_json)
+    elif auto_select:
+        selected_file = _select_main_json(json_members)
+    elif next(json_members, None) is None:
+        raise _selection_error("No JSON files found in TAR archive")
+    else:
+        # If neither select_json nor auto_select is specified, raise an error
+        raise _selection_error(
+            "No selection method specified. Use auto_select=True or provide a select_json index."
+        )
 
-            # Look for JSON files
-            json_files = [m for m in members if m.name.lower().endswith(".json")]
+    logger.info(f"Selected JSON file from archive: {selected_file.name}")
+    return selected_file
 
-            if not json_files:
-                error_msg = "No JSON files found in TAR archive"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
 
-            # Select the JSON file based on the parameters
-            if select_json is not None:
-                # Use the specified JSON file index
-                if select_json < 0 or select_json >= len(json_files):
-                    error_msg = f"Invalid JSON file index {select_json}. Only {len(json_files)} JSON files available."
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-                selected_file = json_files[select_json]
-            elif auto_select:
-                # Try to find the main data file (usually messages.json or similar)
-                # This is a simplified heuristic and might need adjustment
-                main_file_candidates = [
-                    m
-                    for m in json_files
-                    if "message" in m.name.lower() or "export" in m.name.lower()
-                ]
-
-                if main_file_candidates:
-                    selected_file = main_file_candidates[0]
-                else:
-                    selected_file = json_files[0]
-            else:
-                # If neither select_json nor auto_select is specified, raise an error
-                error_msg = "No selection method specified. Use auto_select=True or provide a select_json index."
-                logger.error(error_msg)
-                raise ValueError(error_msg)
+def _extract_member(tar: tarfile.TarFile, member: tarfile.TarInfo) -> BinaryIO:
+    """
+    Open a TAR member for reading.
 
-            logger.info(f"Selected JSON file from archive: {selected_file.name}")
+    Args:
+        tar: Opened TAR archive
+        member: Member to open
 
-            # Extract and read the selected file
-            f = tar.extractfile(selected_file)
-            if f is None:
-                error_msg = f"Failed to extract {selected_file.name} from TAR archive"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
+    Returns:
+        File object for the member contents
 
-            # Read JSON data
-            data = json.load(f)
-            logger.info(
-                f"Successfully read JSON from TAR archive: {selected_file.name}"
-            )
-            return data
-    except Exception as e:
-        error_msg = f"Error reading TAR file {file_path}: {e}"
+    Raises:
+        ValueError: If the member cannot be extracted
+    """
+    f = tar.extractfile(member)
+    if f is None:
+        error_msg = f"Failed to extract {member.name} from TAR archive"
         logger.error(error_msg)
-        raise
+        raise ValueError(error_msg)
+    return f
+
+
+def _read_tar(
+    tar: tarfile.TarFile, auto_select: bool = False, select_json: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Read the selected JSON file from an opened TAR archive.
+
+    This is the shared core of FileHandler.read_tarfile and
+    FileHandler.read_tarfile_object, which only differ in how the archive
+    is opened.
+
+    Args:
+        tar: Opened TAR archive
+        auto_select: Whether to automatically select the main data file
+        select_json: Index of the JSON file to select (0-based)
+
+    Returns:
+        The data read from the selected JSON file
+
+    Raises:
+        ValueError: If no JSON file can be selected or extracted
+    """
+    selected_file = _select_json_member(tar, auto_select, select_json)
+
+    # Extract and read the selected file
+    f = _extract_member(tar, selected_file)
+
+    # Read JSON data through the reused buffer; every parser copies what it
+    # needs, so the buffer is free again once parsing returns
+    if selected_file.isreg():
+        content = _read_into_buffer(f, selected_file.size)
+    else:
+        # Links have no size of their own; extractfile reads the link target
+        content = f.read()
+    data = parse_json(content)
+    logger.info(f"Successfully read JSON from TAR archive: {selected_file.name}")
+    return data
 
 
 class FileHandler(FileHandlerProtocol):
@@ -246,8 +681,8 @@ class FileHandler(FileHandlerProtocol):
         try:
             if ext == ".json":
                 # Read JSON file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(file_path, "rb") as f:
+                    data = parse_json(f.read())
                 logger.info(f"Successfully read JSON file: {file_path}")
                 return data
             elif ext == ".tar":
@@ -266,6 +701,65 @@ class FileHandler(FileHandlerProtocol):
             logger.error(error_msg)
             raise
 
+    def read_file_lazy(self, file_path: str) -> Any:
+        """
+        Read a JSON file without materializing the full Python object tree.
+
+        When pysimdjson is available the parsed document is returned as a lazy
+        simdjson.Object whose fields are only converted to Python objects when
+        accessed, e.g. ``for conv in doc["conversations"]:``. Use
+        materialize_json() to convert a sub-tree into plain dicts and lists.
+        Without pysimdjson, or for non-JSON files, this behaves like read_file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            The lazy document, or the data read from the file
+
+        Raises:
+            ValueError: If the file doesn't exist or has an unsupported format
+        """
+        _, ext = os.path.splitext(file_path)
+        if not SIMDJSON_AVAILABLE or ext.lower() != ".json":
+            return self.read_file(file_path)
+
+        logger.info(f"Reading file lazily: {file_path}")
+
+        # Validate file path
+        if not os.path.exists(file_path):
+            error_msg = f"File does not exist: {file_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if not os.path.isfile(file_path):
+            error_msg = f"Path is not a file: {file_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        try:
+            with open(file_path, "rb") as f:
+                content = f.read()
+            try:
+                # The document keeps a reference to its parser, so each lazy
+                # read gets its own parser to stay valid after later reads
+                doc = _simdjson_parse(simdjson.Parser(), content)
+            except json.JSONDecodeError as e:
+                # simdjson rejects some documents json.loads accepts, such as
+                # lone surrogates, NaN and integers beyond 64 bits
+                logger.debug(f"Lazy parse failed, reading {file_path} eagerly: {e}")
+                doc = parse_json(content)
+            logger.info(f"Successfully read JSON file lazily: {file_path}")
+            return doc
+        except json.JSONDecodeError as e:
+            error_msg = f"Error decoding JSON file {file_path}: {e}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        except Exception as e:
+            error_msg = f"Error reading file {file_path}: {e}"
+            logger.error(error_msg)
+            raise
+
     def read_file_object(
         self, file_obj: BinaryIO, file_name: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -296,7 +790,7 @@ class FileHandler(FileHandlerProtocol):
                 if ext == ".json":
                     # Read JSON from file object
                     file_obj.seek(0)
-                    data = json.load(file_obj)
+                    data = parse_json(file_obj.read())
                     logger.info("Successfully read JSON from file object")
                     return data
                 elif ext == ".tar":
@@ -308,7 +802,7 @@ class FileHandler(FileHandlerProtocol):
             # First try JSON
             try:
                 file_obj.seek(0)
-                data = json.load(file_obj)
+                data = parse_json(file_obj.read())
                 logger.info("Successfully read JSON from file object")
                 return data
             except json.JSONDecodeError:
@@ -348,91 +842,111 @@ class FileHandler(FileHandlerProtocol):
 
         try:
             # Open TAR file
-            with tarfile.open(file_path, "r") as tar:
-                # List all files in the archive
-                members = tar.getmembers()
-                logger.debug(f"Files in archive: {[m.name for m in members]}")
-
-                # Look for JSON files
-                json_files = [m for m in members if m.name.lower().endswith(".json")]
-
-                if not json_files:
-                    error_msg = "No JSON files found in TAR archive"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Select the JSON file based on the parameters
-                if select_json is not None:
-                    # Use the specified JSON file index
-                    if select_json < 0 or select_json >= len(json_files):
-                        error_msg = f"Invalid JSON file index {select_json}. Only {len(json_files)} JSON files available."
-                        logger.error(error_msg)
-                        raise ValueError(error_msg)
-                    selected_file = json_files[select_json]
-                elif auto_select:
-                    # Try to find the main data file (usually messages.json or similar)
-                    # This is a simplified heuristic and might need adjustment
-                    main_file_candidates = [
-                        m
-                        for m in json_files
-                        if "message" in m.name.lower() or "export" in m.name.lower()
-                    ]
-
-                    if main_file_candidates:
-                        selected_file = main_file_candidates[0]
-                    else:
-                        selected_file = json_files[0]
-                else:
-                    # If neither select_json nor auto_select is specified, raise an error
-                    error_msg = "No selection method specified. Use auto_select=True or provide a select_json index."
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
+            with tarfile.open(name=file_path, mode="r") as tar:
+                return _read_tar(tar, auto_select, select_json)
+        except Exception as e:
+            error_msg = f"Error reading TAR file {file_path}: {e}"
+            logger.error(error_msg)
+            raise
 
-                logger.info(f"Selected JSON file from archive: {selected_file.name}")
+    def read_file_streaming(
+        self, file_path: str, prefix: str = "conversations.item"
+    ) -> Iterator[Any]:
+        """
+        Read items from a JSON or TAR file using streaming JSON processing.
 
-                # Extract and read the selected file
-                f = tar.extractfile(selected_file)
-                if f is None:
-                    error_msg = (
-                        f"Failed to extract {selected_file.name} from TAR archive"
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Read JSON data
-                data = json.load(f)
-                logger.info(
-                    f"Successfully read JSON from TAR archive: {selected_file.name}"
-                )
-                return data
+        This method uses ijson to yield each value found at the given prefix
+        (by default each conversation of a Skype export) without loading the
+        whole document, so memory use is bounded by the largest single item.
+
+        Args:
+            file_path: Path to the file
+            prefix: ijson prefix of the items to yield
+
+        Yields:
+            The items found at the prefix
+
+        Raises:
+            ValueError: If the file doesn't exist, has an unsupported format,
+                is not valid JSON, or ijson is not available
+            Exception: If an error occurs during file reading
+        """
+        if not IJSON_AVAILABLE:
+            raise ValueError(
+                "ijson library is required for streaming JSON processing. "
+                "Please install it with 'pip install ijson'"
+            )
+
+        # Determine file type based on extension
+        _, ext = os.path.splitext(file_path)
+        ext = ext.lower()
+
+        if ext == ".tar":
+            yield from self.read_tarfile_streaming(
+                file_path, auto_select=True, prefix=prefix
+            )
+            return
+
+        if ext != ".json":
+            error_msg = f"Unsupported file extension: {ext}. Supported extensions: .json, .tar"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        logger.info(f"Reading file with streaming: {file_path}")
+
+        # Validate file path
+        if not os.path.exists(file_path):
+            error_msg = f"File does not exist: {file_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if not os.path.isfile(file_path):
+            error_msg = f"Path is not a file: {file_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        try:
+            with open(file_path, "rb") as f:
+                yield from ijson.items(f, prefix, use_float=True)
+            logger.info(f"Completed streaming processing of {file_path}")
+        except ijson.JSONError as e:
+            error_msg = f"Error decoding JSON file {file_path}: {e}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
         except Exception as e:
-            error_msg = f"Error reading TAR file {file_path}: {e}"
+            error_msg = f"Error streaming file {file_path}: {e}"
             logger.error(error_msg)
             raise
 
     def read_tarfile_streaming(
-        self, file_path: str, auto_select: bool = False
-    ) -> Iterator[Tuple[str, Any]]:
+        self, file_path: str, auto_select: bool = False, prefix: Optional[str] = None
+    ) -> Iterator[Any]:
         """
         Read data from a tar file using streaming JSON processing.
 
         This method uses ijson for memory-efficient processing of large JSON files.
-        It yields (path, item) tuples for each item in the JSON file.
+        Without a prefix it yields (path, item) tuples for each item in the JSON
+        file. With a prefix it yields each value found at that prefix instead,
+        e.g. prefix="conversations.item" yields one conversation at a time.
 
         Args:
             file_path: Path to the tar file
             auto_select: Whether to automatically select the main data file
+            prefix: Optional ijson prefix of the items to yield
 
         Yields:
-            Tuples of (path, item) where path is the JSON path and item is the value
+            Tuples of (path, item) where path is the JSON path and item is the
+            value, or the items found at the prefix if one is given
 
         Raises:
-            ValueError: If the tar file doesn't exist, is invalid, or ijson is not available
+            ValueError: If the tar file doesn't exist, is invalid, holds invalid JSON,
+                or ijson is not available
             Exception: If an error occurs during file reading
         """
         if not IJSON_AVAILABLE:
             raise ValueError(
-                "ijson library is required for streaming JSON processing. Please install it with 'pip install ijson'"
+                "ijson library is required for streaming JSON processing. "
+                "Please install it with 'pip install ijson'"
             )
 
         logger.info(f"Reading tar file with streaming: {file_path}")
@@ -443,55 +957,29 @@ class FileHandler(FileHandlerProtocol):
 
         try:
             # Open TAR file
-            with tarfile.open(file_path, "r") as tar:
-                # List all files in the archive
-                members = tar.getmembers()
-                logger.debug(f"Files in archive: {[m.name for m in members]}")
-
-                # Look for JSON files
-                json_files = [m for m in members if m.name.lower().endswith(".json")]
-
-                if not json_files:
-                    error_msg = "No JSON files found in TAR archive"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
+            with tarfile.open(name=file_path, mode="r") as tar:
                 # Either auto-select or use the first JSON file
-                if auto_select:
-                    # Try to find the main data file (usually messages.json or similar)
-                    main_file_candidates = [
-                        m
-                        for m in json_files
-                        if "message" in m.name.lower() or "export" in m.name.lower()
-                    ]
-
-                    if main_file_candidates:
-                        selected_file = main_file_candidates[0]
-                    else:
-                        selected_file = json_files[0]
-                else:
-                    selected_file = json_files[0]
-
-                logger.info(
-                    f"Selected JSON file from archive for streaming: {selected_file.name}"
+                selected_file = _select_json_member(
+                    tar, auto_select, None if auto_select else 0
                 )
 
                 # Extract and read the selected file
-                f = tar.extractfile(selected_file)
-                if f is None:
-                    error_msg = (
-                        f"Failed to extract {selected_file.name} from TAR archive"
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
+                f = _extract_member(tar, selected_file)
 
                 # Stream JSON data with ijson
                 logger.debug(f"Starting streaming processing of {selected_file.name}")
-                for path, event, value in ijson.parse(f):
-                    yield (path, value)
+                if prefix is None:
+                    for path, event, value in ijson.parse(f):
+                        yield (path, value)
+                else:
+                    yield from ijson.items(f, prefix, use_float=True)
 
                 logger.info(f"Completed streaming processing of {selected_file.name}")
 
+        except ijson.JSONError as e:
+            error_msg = f"Error decoding JSON in TAR file {file_path}: {e}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
         except Exception as e:
             error_msg = f"Error streaming TAR file {file_path}: {e}"
             logger.error(error_msg)
@@ -536,63 +1024,10 @@ class FileHandler(FileHandlerProtocol):
         logger.info("Reading from tar file object")
 
         try:
-            # Open TAR file from file object
+            # Open TAR file directly from the file object; seekable mode is
+            # kept because index and heuristic selection need the full listing
             with tarfile.open(fileobj=file_obj, mode="r") as tar:
-                # List all files in the archive
-                members = tar.getmembers()
-                logger.debug(f"Files in archive: {[m.name for m in members]}")
-
-                # Look for JSON files
-                json_files = [m for m in members if m.name.lower().endswith(".json")]
-
-                if not json_files:
-                    error_msg = "No JSON files found in TAR archive"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Select the JSON file based on the parameters
-                if select_json is not None:
-                    # Use the specified JSON file index
-                    if select_json < 0 or select_json >= len(json_files):
-                        error_msg = f"Invalid JSON file index {select_json}. Only {len(json_files)} JSON files available."
-                        logger.error(error_msg)
-                        raise ValueError(error_msg)
-                    selected_file = json_files[select_json]
-                elif auto_select:
-                    # Try to find the main data file (usually messages.json or similar)
-                    main_file_candidates = [
-                        m
-                        for m in json_files
-                        if "message" in m.name.lower() or "export" in m.name.lower()
-                    ]
-
-                    if main_file_candidates:
-                        selected_file = main_file_candidates[0]
-                    else:
-                        selected_file = json_files[0]
-                else:
-                    # If neither select_json nor auto_select is specified, raise an error
-                    error_msg = "No selection method specified. Use auto_select=True or provide a select_json index."
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                logger.info(f"Selected JSON file from archive: {selected_file.name}")
-
-                # Extract and read the selected file
-                f = tar.extractfile(selected_file)
-                if f is None:
-                    error_msg = (
-                        f"Failed to extract {selected_file.name} from TAR archive"
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Read JSON data
-                data = json.load(f)
-                logger.info(
-                    f"Successfully read JSON from TAR archive: {selected_file.name}"
-                )
-                return data
+                return _read_tar(tar, auto_select, select_json)
         except Exception as e:
             error_msg = f"Error reading from tar file object: {e}"
             logger.error(error_msg)
@@ -626,6 +1061,22 @@ def read_file(file_path: str) -> Dict[str, Any]:
     return get_service(FileHandlerProtocol).read_file(file_path)
 
 
+def read_file_lazy(file_path: str) -> Any:
+    """Helper function to lazily read a JSON file using the FileHandler."""
+    from src.utils.di import get_service
+
+    return get_service(FileHandlerProtocol).read_file_lazy(file_path)
+
+
+def read_file_streaming(
+    file_path: str, prefix: str = "conversations.item"
+) -> Iterator[Any]:
+    """Helper function to stream items from a file using the FileHandler."""
+    from src.utils.di import get_service
+
+    return get_service(FileHandlerProtocol).read_file_streaming(file_path, prefix)
+
+
 def read_file_obj(
     file_obj: BinaryIO, file_name: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -144,6 +144,19 @@ class FileHandlerProtocol(Protocol):
         """
         ...
 
+    def read_file_lazy(self, file_path: str) -> Any:
+        """
+        Read a JSON file, deferring conversion to Python objects where possible.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            A lazy document supporting dict-style access, or the data read
+            from the file
+        """
+        ...
+
     def read_file_object(
         self, file_obj: BinaryIO, file_name: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -197,18 +210,35 @@ class FileHandlerProtocol(Protocol):
         """
         ...
 
+    def read_file_streaming(
+        self, file_path: str, prefix: str = "conversations.item"
+    ) -> Iterator[Any]:
+        """
+        Read items from a file in a streaming manner.
+
+        Args:
+            file_path: Path to the file
+            prefix: JSON prefix of the items to read
+
+        Returns:
+            Iterator of the items found at the prefix
+        """
+        ...
+
     def read_tarfile_streaming(
-        self, file_path: str, auto_select: bool = False
-    ) -> Iterator[Tuple[str, Any]]:
+        self, file_path: str, auto_select: bool = False, prefix: Optional[str] = None
+    ) -> Iterator[Any]:
         """
         Read data from a tar file in a streaming manner.
 
         Args:
             file_path: Path to the tar file
             auto_select: Whether to automatically select the main data file
+            prefix: Optional JSON prefix of the items to read
 
         Returns:
-            Iterator of (field_name, value) pairs read from the tar file
+            Iterator of (field_name, value) pairs read from the tar file, or of
+            the items found at the prefix if one is given
         """
         ...
 
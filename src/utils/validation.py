@@ -274,10 +274,13 @@ def validate_json_file(
         allow_symlinks=allow_symlinks,
     )
 
+    # Imported here because file_handler imports this module
+    from src.utils.file_handler import parse_json
+
     # Parse the JSON file
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = parse_json(f.read())
         return data
     except json.JSONDecodeError as e:
         raise ValidationError(f"Invalid JSON file: {e}")
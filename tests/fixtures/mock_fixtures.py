@@ -18,6 +18,24 @@ from tests.factories import (
 
 from .skype_data import BASIC_SKYPE_DATA, COMPLEX_SKYPE_DATA, INVALID_SKYPE_DATA
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_bytes(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # orjson is stricter (e.g. non-string keys); fall back to json
+            pass
+    return json.dumps(data).encode("utf-8")
+
 
 class MockFileReader:
     """
@@ -35,6 +53,8 @@ class MockFileReader:
             default_data: Default data to return if path is not found
         """
         self.path_data_map = {}
+        # Serialized data per path (None for the default), filled on first read
+        self.path_bytes_map = {}
         self.default_data = default_data or SkypeDataFactory.build()
 
     def add_file(self, path: str, data: Dict[str, Any]) -> None:
@@ -46,6 +66,26 @@ class MockFileReader:
             data: Data to return when this path is read
         """
         self.path_data_map[path] = data
+        self.path_bytes_map.pop(path, None)
+
+    def read_bytes(self, path: Optional[str] = None) -> bytes:
+        """
+        Read the serialized JSON content of a file path.
+
+        The data is serialized on the first read of each path and cached.
+
+        Args:
+            path: File path, or None for the default data
+
+        Returns:
+            bytes: JSON-encoded data for the file path
+        """
+        key = path if path in self.path_data_map else None
+        content = self.path_bytes_map.get(key)
+        if content is None:
+            data = self.default_data if key is None else self.path_data_map[key]
+            content = self.path_bytes_map[key] = _dump_bytes(data)
+        return content
 
     def read_file(self, path: str) -> Dict[str, Any]:
         """
@@ -86,6 +126,129 @@ class MockFileReader:
         return self.default_data
 
 
+def _to_bytes(query: Any) -> bytes:
+    """Convert a query to bytes the way psycopg2's mogrify would return it."""
+    if isinstance(query, bytes):
+        return query
+    if isinstance(query, str):
+        return query.encode("utf-8")
+    return str(query).encode("utf-8")
+
+
+class _FakeCursor:
+    """
+    Minimal stand-in for a psycopg2 cursor.
+
+    Plain methods on a slotted class avoid the attribute-proxy and call
+    recording overhead of MagicMock, which adds up over the ETL suites.
+    """
+
+    __slots__ = ("_db", "_fetch", "connection")
+
+    description = ()
+    rowcount = -1
+
+    def __init__(self, db: "MockDatabase", connection: "_FakeConn"):
+        # The owning MockDatabase is read on every call, so changes to its
+        # should_fail or executed_queries take effect immediately
+        self._db = db
+        self.connection = connection
+        # Callers only ever index the first column (e.g. RETURNING id)
+        self._fetch = (1,)
+
+    def execute(self, query, params=None):
+        # Store just the query string for easier checking
+        self._db.executed_queries.append(query)
+        if self._db.should_fail:
+            raise Exception("Database operation failed")
+        return self  # Return cursor for method chaining
+
+    def executemany(self, query, params_list=None):
+        return self.execute(query, params_list)
+
+    def mogrify(self, query, params=None) -> bytes:
+        # Return bytes as expected by execute_values
+        return _to_bytes(query)
+
+    def fetchone(self):
+        return self._fetch
+
+    def fetchall(self) -> list:
+        return []
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class _FakeConn:
+    """
+    Minimal stand-in for a database connection.
+
+    Covers both the psycopg2 connection surface (cursor/commit/rollback)
+    and the DatabaseConnectionProtocol methods the loaders call directly.
+    """
+
+    __slots__ = ("_db", "_cursor", "autocommit", "closed")
+
+    # Read by psycopg2.extras.execute_values through cursor.connection
+    encoding = "UTF8"
+
+    def __init__(self, db: "MockDatabase"):
+        self._db = db
+        self._cursor = _FakeCursor(db, self)
+        self.autocommit = False
+        self.closed = False
+
+    def cursor(self, *args, **kwargs) -> _FakeCursor:
+        return self._cursor
+
+    def connect(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def begin_transaction(self) -> None:
+        pass
+
+    def execute(self, query, params=None) -> _FakeCursor:
+        return self._cursor
+
+    def execute_batch(self, query, params_list=None) -> None:
+        # Store just the query string for easier checking
+        self._db.executed_queries.append(query)
+        if self._db.should_fail:
+            raise Exception("Database operation failed")
+        return None
+
+    def fetch_one(self):
+        return self._cursor.fetchone()
+
+    def fetch_all(self) -> list:
+        return self._cursor.fetchall()
+
+    def bulk_insert(self, table: str, columns: list, values: list) -> int:
+        return len(values)
+
+    def __enter__(self) -> "_FakeConn":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
 class MockDatabase:
     """
     Mock database for testing ETL pipeline loading.
@@ -102,59 +265,9 @@ class MockDatabase:
             should_fail: Whether database operations should fail
         """
         self.should_fail = should_fail
-        self.conn = MagicMock()
-        self.cursor = MagicMock()
-        self.conn.cursor.return_value = self.cursor
-
-        # Set up connection encoding for psycopg2.extras.execute_values
-        self.cursor.__enter__.return_value = self.cursor
-        self.cursor.__enter__.return_value.connection.encoding = "UTF8"
-
-        # Set up mogrify to return bytes instead of a MagicMock
-        def mogrify_side_effect(query, params=None):
-            # Convert the query to bytes if it's not already
-            if isinstance(query, str):
-                query_bytes = query.encode("utf-8")
-            elif isinstance(query, bytes):
-                query_bytes = query
-            else:
-                query_bytes = str(query).encode("utf-8")
-
-            # Return bytes as expected by execute_values
-            return query_bytes
-
-        self.cursor.mogrify.side_effect = mogrify_side_effect
-        self.cursor.__enter__.return_value.mogrify.side_effect = mogrify_side_effect
-
         self.executed_queries = []
-
-        # Set up cursor to record executed queries
-        def execute_side_effect(query, params=None):
-            self.executed_queries.append(
-                query
-            )  # Store just the query string for easier checking
-            if self.should_fail:
-                raise Exception("Database operation failed")
-            return self.cursor  # Return cursor for method chaining
-
-        self.cursor.execute.side_effect = execute_side_effect
-
-        # Add execute_batch method to the connection
-        def execute_batch_side_effect(query, params_list=None):
-            self.executed_queries.append(
-                query
-            )  # Store just the query string for easier checking
-            if self.should_fail:
-                raise Exception("Database operation failed")
-            return None
-
-        self.conn.execute_batch = MagicMock(side_effect=execute_batch_side_effect)
-
-        # Make sure fetchone returns something
-        fetchone_result = MagicMock()
-        fetchone_result.__getitem__.return_value = 1
-        self.cursor.fetchone.return_value = fetchone_result
-        self.cursor.__enter__.return_value.fetchone.return_value = fetchone_result
+        self.conn = _FakeConn(self)
+        self.cursor = self.conn.cursor()
 
     def get_executed_queries(self) -> list:
         """
@@ -230,7 +343,7 @@ def create_mock_file_environment(
         "open": patch(
             "builtins.open",
             new_callable=lambda: mock_open(
-                read_data=json.dumps(SkypeDataFactory.build())
+                read_data=file_reader.read_bytes().decode("utf-8")
             ),
         ),
         "validation_service": validation_service,
@@ -5,6 +5,7 @@ Tests for the configuration module.
 
 import copy
 import json
+import logging
 import os
 
 # Add the parent directory to the path so we can import from src
@@ -19,10 +20,16 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from src.utils.config import (
     DEFAULT_CONFIG,
     _deep_update,
+    build_message_type_resolver,
+    config_to_dict,
     get_db_config,
     get_message_type_description,
     load_config,
+    load_config_chained,
+    setup_logging,
 )
+from src.utils.configuration_validator import ConfigurationValidator
+from src.utils.validation import validate_config
 
 
 class TestConfig(unittest.TestCase):
@@ -30,6 +37,9 @@ class TestConfig(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # Make sure configurations cached by other tests are not reused
+        load_config.cache_clear()
+
         # Create a temporary directory
         self.temp_dir = tempfile.mkdtemp()
 
@@ -248,6 +258,15 @@ class TestConfig(unittest.TestCase):
         description = get_message_type_description(config, "")
         self.assertEqual(description, "Unknown message type")
 
+    def test_build_message_type_resolver(self):
+        """Test that the resolver matches get_message_type_description."""
+        config = load_config(message_types_file=self.message_types_file)
+        resolve = build_message_type_resolver(config)
+        for msg_type in ["Test/Type1", "Unknown/Type", "Unknown/Type", ""]:
+            self.assertEqual(
+                resolve(msg_type), get_message_type_description(config, msg_type)
+            )
+
     def test_deep_update(self):
         """Test deep updating a dictionary."""
         target = {"a": 1, "b": {"c": 2, "d": 3}}
@@ -259,6 +278,13 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(target["b"]["e"], 5)
         self.assertEqual(target["f"], 6)
 
+    def test_deep_update_nested(self):
+        """Test deep updating several levels of nested dictionaries."""
+        target = {"a": {"b": {"c": 1, "d": 2}}, "e": 3}
+        source = {"a": {"b": {"c": 5}, "f": 6}, "e": {"g": 7}}
+        _deep_update(target, source)
+        self.assertEqual(target, {"a": {"b": {"c": 5, "d": 2}, "f": 6}, "e": {"g": 7}})
+
     def test_default_config_not_modified(self):
         """Test that the DEFAULT_CONFIG is not modified by load_config."""
         # Store the original values
@@ -272,6 +298,118 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(DEFAULT_CONFIG["database"]["host"], original_host)
         self.assertNotEqual(config["database"]["host"], original_host)
 
+    def test_load_config_cached(self):
+        """Test that load_config caches results and reloads changed files."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_config(config_file=self.config_file)
+            self.assertIsInstance(config, dict)
+            self.assertIsInstance(config["database"], dict)
+
+            # Every call gets its own copy, so modifying one leaves the cache intact
+            config["database"]["host"] = "other-host"
+            config = load_config(config_file=self.config_file)
+            self.assertEqual(config["database"]["host"], "test-host")
+            self.assertIsNot(load_config(config_file=self.config_file), config)
+
+            # Changing the file invalidates the cached configuration
+            self.config_data["database"]["host"] = "changed-host"
+            with open(self.config_file, "w") as f:
+                json.dump(self.config_data, f)
+            stat = os.stat(self.config_file)
+            os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            config = load_config(config_file=self.config_file)
+            self.assertEqual(config["database"]["host"], "changed-host")
+
+            # Changing an environment variable also invalidates it
+            with patch.dict(os.environ, {"POSTGRES_HOST": "env-host"}):
+                self.assertEqual(
+                    load_config(config_file=self.config_file)["database"]["host"],
+                    "env-host",
+                )
+
+    def test_load_config_returns_plain_dicts(self):
+        """Test that load_config results work with callers expecting dicts."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_config(config_file=self.config_file)
+
+        self.assertTrue(validate_config(config))
+        ConfigurationValidator.validate_db_config(config["database"])
+        self.assertEqual(json.loads(json.dumps(config)), config)
+        self.assertEqual(copy.deepcopy(config), config)
+
+    def test_load_config_chained(self):
+        """Test that chained configuration resolves like load_config."""
+        with patch.dict(
+            os.environ, {"POSTGRES_HOST": "env-host", "LOG_LEVEL": "ERROR"}, clear=True
+        ):
+            expected = config_to_dict(
+                load_config(
+                    config_file=self.config_file,
+                    message_types_file=self.message_types_file,
+                )
+            )
+            config = load_config_chained(
+                config_file=self.config_file,
+                message_types_file=self.message_types_file,
+            )
+
+        self.assertEqual(config_to_dict(config), expected)
+        self.assertEqual(config["database"]["host"], "env-host")
+        self.assertEqual(config["database"]["port"], 5555)
+        self.assertEqual(config["logging"]["level"], "ERROR")
+        self.assertEqual(config["chunk_size"], 1000)
+        # Message types from the file replace the defaults instead of merging
+        self.assertNotIn("Poll", config["message_types"])
+
+        # Writes never reach the shared default layer
+        config["output"]["directory"] = "changed"
+        self.assertEqual(DEFAULT_CONFIG["output"]["directory"], "output")
+
+    def test_setup_logging_configures_once(self):
+        """Test that repeated setup_logging calls do not rebuild handlers."""
+        config = load_config(config_file=self.config_file)
+        with patch.object(setup_logging, "_settings", None, create=True), patch(
+            "src.utils.structured_logging.setup_logging"
+        ) as mock_setup:
+            setup_logging(config)
+            setup_logging(config)
+
+        mock_setup.assert_called_once()
+        self.assertEqual(mock_setup.call_args.kwargs["level"], logging.DEBUG)
+
+    def test_setup_logging_reconfigures_on_change(self):
+        """Test that setup_logging applies changed logging settings."""
+        config = load_config(config_file=self.config_file)
+        with patch.object(setup_logging, "_settings", None, create=True), patch(
+            "src.utils.structured_logging.setup_logging"
+        ) as mock_setup:
+            setup_logging(config)
+            config["logging"]["level"] = "ERROR"
+            setup_logging(config)
+            config["logging"]["file"] = "other.log"
+            setup_logging(config)
+
+        self.assertEqual(mock_setup.call_count, 3)
+        self.assertEqual(mock_setup.call_args.kwargs["level"], logging.ERROR)
+        self.assertEqual(mock_setup.call_args.kwargs["log_file"], "other.log")
+
+    def test_setup_logging_level_aliases(self):
+        """Test that logging level aliases such as WARN are honoured."""
+        config = load_config(config_file=self.config_file)
+        levels = {
+            "WARN": logging.WARNING,
+            "fatal": logging.CRITICAL,
+            "NOTSET": logging.NOTSET,
+            "bogus": logging.INFO,
+        }
+        for name, level in levels.items():
+            config["logging"]["level"] = name
+            with patch.object(setup_logging, "_settings", None, create=True), patch(
+                "src.utils.structured_logging.setup_logging"
+            ) as mock_setup:
+                setup_logging(config)
+            self.assertEqual(mock_setup.call_args.kwargs["level"], level, name)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src.db.etl import ETLContext
+from src.utils.config import load_config
 
 class TestETLContext(unittest.TestCase):
     """Test cases for the ETLContext class."""
@@ -71,6 +72,13 @@ class TestETLContext(unittest.TestCase):
         self.assertIsNotNone(context.start_time)
         self.assertIsNone(context.file_source)
 
+    def test_init_with_loaded_db_config(self):
+        """Test initialization with the database section of load_config()."""
+        db_config = load_config()["database"]
+        context = ETLContext(db_config=db_config, output_dir=self.temp_dir)
+
+        self.assertEqual(context.db_config, db_config)
+
     def test_start_phase(self):
         """Test starting a phase."""
         context = ETLContext(
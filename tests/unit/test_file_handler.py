@@ -3,8 +3,13 @@
 Tests for the file_handler.py module.
 """
 
+import fnmatch
+import io
 import json
+import math
 import os
+import re
+import tarfile
 
 # Add the parent directory to the path so we can import from src
 import sys
@@ -14,11 +19,18 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+import src.utils.file_handler as file_handler_module
 from src.utils.file_handler import (
     FileHandler,
+    _compile_name_filter,
+    parse_json,
+    _read_into_buffer,
     extract_tar_contents,
     list_tar_contents,
+    materialize_json,
     read_file,
+    read_file_lazy,
+    read_file_streaming,
     read_file_obj,
     read_tar_file_obj,
     read_tarfile,
@@ -77,6 +89,48 @@ class TestFileHandler(TestBase):
         with self.assertRaises(ValueError):
             read_file(txt_file)
 
+    @patch("src.utils.di.get_service", return_value=FileHandler())
+    def test_read_file_lazy(self, mock_get_service):
+        """Test read_file_lazy function."""
+        doc = read_file_lazy(self.json_file)
+        self.assertEqual(doc["test"], "data")
+        self.assertEqual(materialize_json(doc), self.json_data)
+
+        # Test with non-existent file
+        with self.assertRaises(ValueError):
+            read_file_lazy(os.path.join(self.test_dir, "nonexistent.json"))
+
+    @patch_validation
+    @patch("src.utils.di.get_service", return_value=FileHandler())
+    def test_read_file_streaming(self, mock_get_service, mock_validate_path):
+        """Test read_file_streaming function."""
+        conversations = [{"id": "conv1"}, {"id": "conv2", "score": 1.5}]
+        export_file = create_test_json_file(
+            self.test_dir, "export.json", {"conversations": conversations}
+        )
+
+        # Test streaming conversations from a JSON file
+        self.assertEqual(list(read_file_streaming(export_file)), conversations)
+
+        # Test streaming a custom prefix from the selected file in a TAR file
+        self.assertEqual(list(read_file_streaming(self.tar_file, prefix="file")), ["1"])
+
+        # Test with non-existent file
+        with self.assertRaises(ValueError):
+            list(read_file_streaming(os.path.join(self.test_dir, "nonexistent.json")))
+
+        # Test with a truncated JSON file
+        truncated_file = os.path.join(self.test_dir, "truncated.json")
+        with open(truncated_file, "w") as f:
+            f.write('{"conversations": [{"id": "conv1"}, ')
+        with self.assertRaisesRegex(ValueError, "Error decoding JSON file"):
+            list(read_file_streaming(truncated_file))
+        truncated_tar = create_test_tar_file(
+            self.test_dir, "truncated.tar", {"messages.json": '{"conversations": ['}
+        )
+        with self.assertRaisesRegex(ValueError, "Error decoding JSON in TAR file"):
+            list(read_file_streaming(truncated_tar))
+
     def test_read_file_object(self):
         """Test read_file_object function."""
         # Test with valid file object
@@ -186,11 +240,182 @@ class TestFileHandler(TestBase):
         self.assertIn("file1.json", files)
         self.assertIn("file2.json", files)
 
+        # Test with a glob pattern
+        files = list_tar_contents(self.tar_file, file_pattern="file?.json", glob=True)
+        self.assertEqual(sorted(files), ["file1.json", "file2.json"])
+
         # Test with non-existent file
         mock_validate_path.side_effect = ValidationError("File does not exist")
         with self.assertRaises(ValidationError):
             list_tar_contents(os.path.join(self.test_dir, "nonexistent.tar"))
 
+    def test_json_loads_parser_fallbacks(self):
+        """Test that parse_json gives the same result for every parser."""
+        content = json.dumps({"messages": [{"id": 1, "content": "caf\u00e9"}]})
+
+        for orjson_available, simdjson_available in [
+            (file_handler_module.ORJSON_AVAILABLE, False),
+            (False, file_handler_module.SIMDJSON_AVAILABLE),
+            (False, False),
+        ]:
+            with patch.object(
+                file_handler_module, "ORJSON_AVAILABLE", orjson_available
+            ), patch.object(
+                file_handler_module, "SIMDJSON_AVAILABLE", simdjson_available
+            ):
+                self.assertEqual(parse_json(content.encode("utf-8")), json.loads(content))
+                self.assertEqual(parse_json(content), json.loads(content))
+                with self.assertRaises(json.JSONDecodeError):
+                    parse_json(b"{not json")
+                with self.assertRaises(json.JSONDecodeError):
+                    parse_json('{"utf": 16}'.encode("utf-16"))
+
+    def test_json_loads_stdlib_only_documents(self):
+        """Test that documents only json.loads handles parse the same everywhere."""
+        big = 123456789012345678901234567890
+        content = '{"s": "\\ud83d", "n": NaN, "big": %d, "id": "%d"}' % (big, big)
+
+        for orjson_available, simdjson_available in [
+            (file_handler_module.ORJSON_AVAILABLE, False),
+            (False, file_handler_module.SIMDJSON_AVAILABLE),
+            (False, False),
+        ]:
+            with patch.object(
+                file_handler_module, "ORJSON_AVAILABLE", orjson_available
+            ), patch.object(
+                file_handler_module, "SIMDJSON_AVAILABLE", simdjson_available
+            ):
+                for document in (content, content.encode("utf-8")):
+                    data = parse_json(document)
+                    self.assertEqual(data["s"], "\ud83d")
+                    self.assertTrue(math.isnan(data["n"]))
+                    self.assertEqual(data["big"], big)
+                    self.assertIsInstance(data["big"], int)
+                    self.assertEqual(data["id"], str(big))
+
+    def test_read_file_lazy_falls_back_to_eager_parse(self):
+        """Test that read_file_lazy reads documents simdjson rejects eagerly."""
+        big_file = os.path.join(self.test_dir, "big.json")
+        with open(big_file, "w") as f:
+            f.write('{"big": 123456789012345678901234567890, "n": NaN}')
+
+        data = FileHandler().read_file_lazy(big_file)
+        self.assertEqual(data["big"], 123456789012345678901234567890)
+        self.assertTrue(math.isnan(data["n"]))
+
+    def test_compile_name_filter_matches_regex(self):
+        """Test that _compile_name_filter agrees with re.match."""
+        patterns = [
+            r".*\.json",
+            r".*\.json$",
+            r"^.*\.json$",
+            r"messages\.json$",
+            "messages",
+            r"a\$",
+            r"\d+",
+            r".*\.tx?t",
+            "",
+        ]
+        names = [
+            "messages.json",
+            "data/messages.json",
+            "a.json.bak",
+            "file.txt",
+            "a$",
+            "123",
+            "",
+        ]
+
+        for pattern in patterns:
+            matches = _compile_name_filter(pattern)
+            for name in names:
+                self.assertEqual(
+                    bool(matches(name)),
+                    bool(re.match(pattern, name)),
+                    f"pattern={pattern!r} name={name!r}",
+                )
+
+    def test_read_into_buffer_reuses_buffer(self):
+        """Test that _read_into_buffer reads into one reused buffer."""
+        view = _read_into_buffer(io.BytesIO(b'{"a": 1}'), 8)
+        self.assertEqual(bytes(view), b'{"a": 1}')
+        buffer = view.obj
+
+        # A smaller read reuses the buffer, a short read returns what was read
+        view = _read_into_buffer(io.BytesIO(b"[1]"), 5)
+        self.assertEqual(bytes(view), b"[1]")
+        self.assertIs(view.obj, buffer)
+
+        # A larger read gets a new buffer
+        view = _read_into_buffer(io.BytesIO(b"[1, 2, 3, 4]"), 12)
+        self.assertEqual(bytes(view), b"[1, 2, 3, 4]")
+        self.assertIsNot(view.obj, buffer)
+
+    def test_read_tarfile_object_hard_link(self):
+        """Test reading a JSON member that is a hard link to another member."""
+        content = json.dumps({"h": 1}).encode("utf-8")
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            original = tarfile.TarInfo("data/orig.json")
+            original.size = len(content)
+            tar.addfile(original, io.BytesIO(content))
+            link = tarfile.TarInfo("messages.json")
+            link.type = tarfile.LNKTYPE
+            link.linkname = "data/orig.json"
+            tar.addfile(link)
+        archive.seek(0)
+
+        # The link member has size 0; its content comes from the link target
+        data = FileHandler().read_tarfile_object(archive, auto_select=True)
+        self.assertEqual(data, {"h": 1})
+
+    def test_compile_name_filter_matches_glob(self):
+        """Test that _compile_name_filter matches glob patterns like fnmatch."""
+        patterns = ["*.json", "messages/*.json", "messages*", "*json*", "?.json", "*"]
+        names = [
+            "messages.json",
+            "messages/endpoints.json",
+            "a.json.bak",
+            "b.json",
+            "file.txt",
+            "",
+        ]
+
+        for pattern in patterns:
+            matches = _compile_name_filter(pattern, glob=True)
+            for name in names:
+                self.assertEqual(
+                    bool(matches(name)),
+                    fnmatch.fnmatchcase(name, pattern),
+                    f"pattern={pattern!r} name={name!r}",
+                )
+
+        # Patterns that are not valid regexes are treated as globs
+        for pattern in ["*.json", "*json*", "?.json", "*"]:
+            matches = _compile_name_filter(pattern)
+            for name in names:
+                self.assertEqual(
+                    bool(matches(name)),
+                    fnmatch.fnmatchcase(name, pattern),
+                    f"pattern={pattern!r} name={name!r}",
+                )
+
+    def test_compile_name_filter_prefers_regex(self):
+        """Test that valid regexes keep re.match semantics without glob=True."""
+        names = ["contacts.json", "conversations.json", "message.json", "messages.json"]
+
+        for pattern in ["conv*", "messages?.json", "messages*", "c.*s"]:
+            matches = _compile_name_filter(pattern)
+            for name in names:
+                self.assertEqual(
+                    bool(matches(name)),
+                    bool(re.match(pattern, name)),
+                    f"pattern={pattern!r} name={name!r}",
+                )
+
+        self.assertTrue(_compile_name_filter("conv*")("contacts.json"))
+        self.assertTrue(_compile_name_filter("messages?.json")("message.json"))
+        self.assertFalse(_compile_name_filter("conv*", glob=True)("contacts.json"))
 
 if __name__ == "__main__":
     unittest.main()
@@ -51,9 +51,9 @@ def message_types_config():
 
 def test_known_message_types(message_types_config, message_type_descriptions):
     """Test type_parser with known message types."""
-    with patch('src.parser.core_parser.get_message_type_description') as mock_get_description:
+    with patch('src.parser.core_parser._resolve_message_type') as mock_get_description:
         # Configure the mock to return descriptions from the centralized expectations
-        mock_get_description.side_effect = lambda config, msg_type: message_type_descriptions.get(
+        mock_get_description.side_effect = lambda msg_type: message_type_descriptions.get(
             msg_type,
             "***Sent a {message_type}***".format(message_type=msg_type)
         )
@@ -74,9 +74,9 @@ def test_unknown_message_types(message_types_config):
     # Configure the mock to return the default format for unknown types
     default_format = message_types_config['config']['default_message_format']
 
-    with patch('src.parser.core_parser.get_message_type_description') as mock_get_description:
+    with patch('src.parser.core_parser._resolve_message_type') as mock_get_description:
         with patch('src.parser.core_parser.logger') as mock_logger:
-            mock_get_description.side_effect = lambda config, msg_type: default_format.format(message_type=msg_type)
+            mock_get_description.side_effect = lambda msg_type: default_format.format(message_type=msg_type)
 
             # Test unknown message type
             unknown_type = "UnknownType"
@@ -120,9 +120,9 @@ def test_enhanced_message_types():
         "Event/Call": "***Started a call***"
     }
 
-    with patch('src.parser.core_parser.get_message_type_description') as mock_get_description:
+    with patch('src.parser.core_parser._resolve_message_type') as mock_get_description:
         # Configure the mock to return enhanced descriptions
-        mock_get_description.side_effect = lambda config, msg_type: enhanced_message_types.get(
+        mock_get_description.side_effect = lambda msg_type: enhanced_message_types.get(
             msg_type,
             "***Sent a {message_type}***".format(message_type=msg_type)
         )
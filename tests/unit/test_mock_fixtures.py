@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the mock file reader and database in tests/fixtures/mock_fixtures.py.
+"""
+
+import json
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path so we can import from src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from tests.fixtures.mock_fixtures import (
+    MockDatabase,
+    MockFileReader,
+    create_mock_file_environment,
+)
+
+
+class TestMockFileReader(unittest.TestCase):
+    """Test the serialized content provided by MockFileReader."""
+
+    def test_read_bytes(self):
+        """Test that read_bytes serializes each path lazily and caches it."""
+        reader = MockFileReader(default_data={"default": True})
+        reader.add_file("a.json", {"a": 1})
+        self.assertEqual(reader.path_bytes_map, {})
+
+        content = reader.read_bytes("a.json")
+        self.assertEqual(json.loads(content), {"a": 1})
+        self.assertIs(reader.read_bytes("a.json"), content)
+
+        # Unknown paths and no path both give the default data
+        self.assertEqual(json.loads(reader.read_bytes("missing.json")), {"default": True})
+        self.assertEqual(json.loads(reader.read_bytes()), {"default": True})
+
+        # Replacing a file's data invalidates its cached content
+        reader.add_file("a.json", {"a": 2})
+        self.assertEqual(json.loads(reader.read_bytes("a.json")), {"a": 2})
+
+    def test_open_returns_text(self):
+        """Test that the mocked open() returns str in text mode."""
+        with self.assertWarns(DeprecationWarning):
+            open_patch = create_mock_file_environment()["open"]
+        with open_patch:
+            with open("export.json") as f:
+                content = f.read()
+
+        self.assertIsInstance(content, str)
+        self.assertIsInstance(json.loads(content), dict)
+
+
+class TestMockDatabase(unittest.TestCase):
+    """Test the fake connection and cursor provided by MockDatabase."""
+
+    def test_cursor_records_queries(self):
+        """Test that executed queries are recorded in order."""
+        mock_db = MockDatabase()
+        with mock_db.conn.cursor() as cursor:
+            self.assertIs(cursor, mock_db.cursor)
+            self.assertIs(cursor.execute("INSERT INTO a"), cursor)
+        mock_db.conn.execute_batch("INSERT INTO b", [(1,), (2,)])
+
+        self.assertEqual(mock_db.get_executed_queries(), ["INSERT INTO a", "INSERT INTO b"])
+
+    def test_cursor_results(self):
+        """Test fetchone, fetchall, mogrify and the connection encoding."""
+        mock_db = MockDatabase()
+
+        self.assertEqual(mock_db.cursor.fetchone()[0], 1)
+        self.assertEqual(mock_db.cursor.fetchall(), [])
+        self.assertEqual(mock_db.conn.fetch_all(), [])
+        self.assertEqual(mock_db.cursor.description, ())
+        self.assertEqual(mock_db.cursor.mogrify("SELECT %s", (1,)), b"SELECT %s")
+        self.assertEqual(mock_db.cursor.mogrify(b"SELECT 1"), b"SELECT 1")
+        self.assertEqual(mock_db.cursor.connection.encoding, "UTF8")
+
+    def test_should_fail(self):
+        """Test that should_fail makes operations raise, even when set later."""
+        mock_db = MockDatabase(should_fail=True)
+        with self.assertRaisesRegex(Exception, "Database operation failed"):
+            mock_db.cursor.execute("INSERT INTO a")
+
+        mock_db.should_fail = False
+        mock_db.cursor.execute("INSERT INTO b")
+
+        mock_db.should_fail = True
+        with self.assertRaisesRegex(Exception, "Database operation failed"):
+            mock_db.conn.execute_batch("INSERT INTO c")
+
+        # Failed operations are still recorded
+        self.assertEqual(
+            mock_db.get_executed_queries(), ["INSERT INTO a", "INSERT INTO b", "INSERT INTO c"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,7 +81,7 @@ class TestSkypeParser(unittest.TestCase):
         shutil.rmtree(self.temp_dir)
 
     @patch("argparse.ArgumentParser.parse_args")
-    @patch("src.parser.skype_parser.read_file")
+    @patch("src.parser.skype_parser.read_file_lazy")
     @patch("src.parser.skype_parser.parse_skype_data")
     @patch("src.parser.skype_parser.export_conversations")
     def test_main_with_json_file(self, mock_export, mock_parse, mock_read, mock_args):
@@ -108,7 +108,7 @@ class TestSkypeParser(unittest.TestCase):
             text_output=False,
         )
 
-        # Mock the read_file function to return our sample data
+        # Mock the read_file_lazy function to return our sample data
         mock_read.return_value = self.sample_skype_data
 
         # Mock the parse_skype_data function to return structured data
@@ -229,7 +229,7 @@ class TestSkypeParser(unittest.TestCase):
 
     @patch("argparse.ArgumentParser.parse_args")
     @patch("src.parser.skype_parser.SkypeETLPipeline")
-    @patch("src.parser.skype_parser.read_file")
+    @patch("src.parser.skype_parser.read_file_lazy")
     @patch("src.parser.skype_parser.parse_skype_data")
     def test_main_with_db_storage(self, mock_parse, mock_read, mock_etl, mock_args):
         """Test main function with database storage."""
@@ -255,7 +255,7 @@ class TestSkypeParser(unittest.TestCase):
             text_output=False,
         )
 
-        # Mock the read_file function to return our sample data
+        # Mock the read_file_lazy function to return our sample data
         mock_read.return_value = self.sample_skype_data
 
         # Mock the parse_skype_data function to return structured data
@@ -193,7 +193,7 @@ def test_main_with_json_file(
 
     # Apply monkeypatches
     monkeypatch.setattr("argparse.ArgumentParser.parse_args", lambda _: mock_args)
-    monkeypatch.setattr("src.parser.skype_parser.read_file", mock_read_file)
+    monkeypatch.setattr("src.parser.skype_parser.read_file_lazy", mock_read_file)
     monkeypatch.setattr("src.parser.skype_parser.parse_skype_data", mock_parse_skype_data)
     monkeypatch.setattr("src.parser.skype_parser.export_conversations", mock_export_conversations)
     monkeypatch.setattr("sys.exit", lambda code: None)  # Prevent sys.exit from stopping the test
@@ -269,7 +269,7 @@ def test_main_with_db_storage(
 
     # Apply monkeypatches
     monkeypatch.setattr("argparse.ArgumentParser.parse_args", lambda _: mock_args)
-    monkeypatch.setattr("src.parser.skype_parser.read_file", mock_read_file)
+    monkeypatch.setattr("src.parser.skype_parser.read_file_lazy", mock_read_file)
     monkeypatch.setattr("src.parser.skype_parser.ETL_AVAILABLE", True)
     monkeypatch.setattr("src.parser.skype_parser.SkypeETLPipeline", mock_etl_pipeline)
     monkeypatch.setattr("sys.exit", lambda code: None)  # Prevent sys.exit from stopping the test
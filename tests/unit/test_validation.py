@@ -526,6 +526,20 @@ def test_validate_json_file(valid_json_file, invalid_json_file):
         validate_json_file(invalid_json_file)
 
 
+def test_validate_json_file_requires_utf8(test_dir):
+    # UTF-16 and UTF-8 with a BOM are rejected, as with a text-mode UTF-8 read
+    for name, content in [
+        ("utf16.json", '{"test": "data"}'.encode("utf-16")),
+        ("bom.json", '\ufeff{"test": "data"}'.encode("utf-8")),
+    ]:
+        file_path = os.path.join(test_dir, name)
+        with open(file_path, "wb") as f:
+            f.write(content)
+
+        with pytest.raises(ValidationError):
+            validate_json_file(file_path, allow_absolute=True)
+
+
 def test_validate_skype_data(valid_skype_data):
     # Test valid Skype data
     assert validate_skype_data(valid_skype_data) is True